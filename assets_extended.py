@@ -550,16 +550,18 @@ class AssetManager:
     def _load_registry(self):
         """Load asset registry from disk."""
         registry_file = self.project_dir / "asset_registry.json"
-        if registry_file.exists():
-            try:
-                with open(registry_file, 'r') as f:
-                    registry = json.load(f)
-                    for uid, asset_data in registry.items():
-                        metadata = AssetMetadata.from_dict(asset_data)
-                        asset = Asset(metadata)
-                        self.assets[uid] = asset
-            except Exception as e:
-                print(f"Failed to load registry: {e}")
+        try:
+            # open directly instead of checking exists() first, a missing registry is the only case to skip
+            with open(registry_file, 'r') as f:
+                registry = json.load(f)
+                for uid, asset_data in registry.items():
+                    metadata = AssetMetadata.from_dict(asset_data)
+                    asset = Asset(metadata)
+                    self.assets[uid] = asset
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Failed to load registry: {e}")
     
     def save_registry(self):
         """Save asset registry to disk."""
@@ -23,6 +23,12 @@ class LP_MaterialProperties(bpy.types.PropertyGroup):
                                   description="UID of this material. Empty if it hasn't been used by LP yet",
                                   default="")
 
+    def ensure_uid(self):
+        """ returns the uid of this material, assigning one first if it doesn't have one yet """
+        if not self.uid:
+            self.uid = utils.make_uid()
+        return self.uid
+
     layers: bpy.props.CollectionProperty(type=LP_LayerProperties)
 
     def update_selected(self, context):
@@ -143,7 +149,7 @@ class LP_MaterialProperties(bpy.types.PropertyGroup):
 
         # initialize layer
         layer = self.layers[self.selected_index]
-        layer.init(ngroup, layer_type, self.uid)
+        layer.init(ngroup, layer_type, self.ensure_uid())
 
         self.update_preview()
 
@@ -242,7 +248,7 @@ class LP_MaterialProperties(bpy.types.PropertyGroup):
     def add_channel(self, inp):
         """ adds a channel for the given input """
         channel = self.channels.add()
-        channel.init(inp, self.uid)
+        channel.init(inp, self.ensure_uid())
 
         self.__update_layer_channels()
 
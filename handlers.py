@@ -1,11 +1,14 @@
 import bpy
 from bpy.app.handlers import persistent
 import atexit
+import functools
+import re
 
-from .utils import make_uid
+from .utils import make_uid, make_uids
 from .data.materials.channels import channel
 from .data.materials.layers import layer
 from .operators.assets import load_assets
+from .operators import images
 
 # Import logging
 try:
@@ -17,59 +20,118 @@ except ImportError:
     logger = None
 
 
-def _detect_and_fix_duplicates():
+# fingerprint of (name, uid) pairs after the last duplicate fix, None when unknown
+_last_fingerprint = None
+
+
+def _materials_fingerprint(pairs):
+    """Returns a cheap fingerprint of the materials' (name, uid) pairs, in collection order."""
+    return (len(pairs), hash(tuple(pairs)))
+
+
+# Blender's duplicate suffix: ".001", ".002", ...
+_SUFFIX_RE = re.compile(r'\.\d{3,}\Z')
+
+
+@functools.lru_cache(maxsize=1024)
+def _base_name(name):
+    """Strips Blender's numeric duplicate suffix: "Material.001" -> "Material"."""
+    return _SUFFIX_RE.sub('', name)
+
+
+def _duplicate_key(name, lp):
+    """Returns the structural key shared by a material and its duplicates."""
+    return (_base_name(name), len(lp.layers), tuple(c.uid for c in lp.channels))
+
+
+def _detect_and_fix_duplicates(assign_missing=True):
     """Detects and fixes material UID duplicates caused by material duplication.
     When a material is duplicated in Blender, the new material inherits no properties.
-    This function identifies duplicates by name similarity and syncs UIDs.
+    This function identifies duplicates by base name and layer/channel structure and syncs UIDs.
+    Materials are bucketed by that structure in a single pass, so the cost is linear in the
+    number of materials. With assign_missing, materials that aren't duplicates get a new UID
+    in the same pass, otherwise they are left without one.
     """
+    global _last_fingerprint
+    # the only walk over the collection, each mat.lp access is an RNA lookup so it's resolved once per material
+    entries = [(mat.name, mat.lp) for mat in bpy.data.materials]
+    pairs = [(name, lp.uid) for name, lp in entries]
+    if _last_fingerprint is not None and _materials_fingerprint(pairs) == _last_fingerprint:
+        return
+    
     if logger:
         logger.debug("Checking for material UID duplicates")
     
     duplicate_count = 0
     new_uid_count = 0
     
-    for mat in bpy.data.materials:
-        if not mat.lp.uid:
-            # Check if this might be a duplicate (same base name, different suffix)
-            base_name = mat.name.split('.')[0]  # "Material.001" -> "Material"
-            
-            # Look for original material with same base name
-            for other_mat in bpy.data.materials:
-                if other_mat != mat and other_mat.lp.uid:
-                    other_base = other_mat.name.split('.')[0]
-                    if base_name == other_base and len(mat.lp.layers) == len(other_mat.lp.layers):
-                        # Likely duplicate: assign same UID
-                        mat.lp.uid = other_mat.lp.uid
-                        if logger:
-                            logger.debug(f"Assigned UID {mat.lp.uid} to duplicate material '{mat.name}'")
-                        duplicate_count += 1
-                        break
-            
-            # If still no UID, generate new one
-            if not mat.lp.uid:
-                mat.lp.uid = make_uid()
-                if logger:
-                    logger.debug(f"Generated new UID {mat.lp.uid} for material '{mat.name}'")
-                new_uid_count += 1
+    # structure key -> (name, uid) of the material duplicates should inherit from (lowest name wins)
+    sources = {}
+    # every UID already in use, so a freshly drawn one can never collide with a different material's
+    taken = set()
+    missing = []
+    # names are unique, so unless some name carries a ".NNN" suffix no two materials can share
+    # a base name and there are no duplicates; the unique name then serves as the key
+    has_suffixes = any(_SUFFIX_RE.search(name) for name, _ in entries)
+    for index, ((name, lp), (_, uid)) in enumerate(zip(entries, pairs)):
+        key = _duplicate_key(name, lp) if has_suffixes else name
+        if uid:
+            taken.add(uid)
+            source = sources.get(key)
+            if source is None or name < source[0]:
+                sources[key] = (name, uid)
+        else:
+            missing.append((index, name, lp, key))
+    
+    # draw all the UIDs this pass could need from one random buffer
+    new_uids = iter(make_uids(len(missing))) if assign_missing and missing else None
+    for index, name, lp, key in missing:
+        source = sources.get(key)
+        if source is not None:
+            # Likely duplicate: assign same UID
+            uid = lp.uid = source[1]
+            pairs[index] = (name, uid)
+            if logger:
+                logger.debug(f"Assigned UID {uid} to duplicate material '{name}'")
+            duplicate_count += 1
+        elif assign_missing:
+            uid = next(new_uids, None)
+            while uid is None or uid in taken:
+                uid = make_uid()
+            lp.uid = uid
+            taken.add(uid)
+            sources[key] = (name, uid)
+            pairs[index] = (name, uid)
+            if logger:
+                logger.debug(f"Generated new UID {uid} for material '{name}'")
+            new_uid_count += 1
     
     if logger and (duplicate_count > 0 or new_uid_count > 0):
         logger.info(f"UID initialization: {duplicate_count} duplicates synced, {new_uid_count} new UIDs generated")
+    
+    # only a pass that left every material with a UID can be skipped next time,
+    # pairs already holds the UIDs just assigned so the collection isn't walked again
+    if assign_missing:
+        _last_fingerprint = _materials_fingerprint(pairs)
+
+
+def _invalidate_fingerprint():
+    """Forces the next duplicate check to do a full pass."""
+    global _last_fingerprint
+    _last_fingerprint = None
 
 
 def set_material_uids():
     """Assigns UIDs to materials without them. Fixed to handle duplicates."""
-    _detect_and_fix_duplicates()
+    _detect_and_fix_duplicates(assign_missing=True)
 
 
-@persistent
-def on_load_handler(dummy):
-    """Runs when a blender file is loaded"""
-    if logger:
-        logger.info("=" * 60)
-        logger.info("File loaded: clearing all caches and initializing UIDs")
-        logger.debug(f"Materials in file: {len(bpy.data.materials)}")
-    
-    # Clear caches
+def _invalidate_and_resync(full=True):
+    """Clears all caches and re-initializes UIDs, shared by the load and undo/redo handlers.
+    Unless full is set, the UID pass returns early when the material fingerprint hasn't changed.
+    """
+    if full:
+        _invalidate_fingerprint()
     channel.clear_caches()
     if logger:
         log_cache_clear("channel")
@@ -78,8 +140,20 @@ def on_load_handler(dummy):
     if logger:
         log_cache_clear("layer")
     
-    # Initialize UIDs
+    images.clear_caches()
+    
     set_material_uids()
+
+
+@persistent
+def on_load_handler(dummy):
+    """Runs when a blender file is loaded"""
+    if logger:
+        logger.info("=" * 60)
+        logger.info("File loaded: clearing all caches and initializing UIDs")
+        logger.debug(f"Materials in file: {len(bpy.data.materials)}")
+    
+    _invalidate_and_resync()
     
     # Load assets
     try:
@@ -102,12 +176,12 @@ def pre_save_handler(dummy):
 
 
 @persistent
-def depsgraph_handler(dummy):
+def depsgraph_handler(dummy=None):
     """Runs after the depsgraph is updated.
     NOTE: Disabled high-frequency UID sync to prevent performance issues (was causing 60+x/sec calls).
     UID assignment now handled in on_load_handler() and on_undo_redo_handler().
+    Not registered anymore, kept for code that still calls it directly.
     """
-    pass  # Previously called set_material_uids() causing lag
 
 
 def on_exit_handler():
@@ -122,16 +196,9 @@ def on_undo_redo_handler(dummy):
     if logger:
         logger.debug("Undo/Redo detected: clearing all caches")
     
-    channel.clear_caches()
-    if logger:
-        log_cache_clear("channel")
-    
-    layer.clear_caches()
-    if logger:
-        log_cache_clear("layer")
-    
-    # Re-initialize UIDs after undo/redo
-    set_material_uids()
+    # undo restores data and leaves cached pointers stale, but most undo steps don't touch materials,
+    # so the fingerprint acts as the dirty flag for the UID pass
+    _invalidate_and_resync(full=False)
 
 
 def register():
@@ -141,7 +208,6 @@ def register():
     
     bpy.app.handlers.load_post.append(on_load_handler)
     bpy.app.handlers.save_pre.append(pre_save_handler)
-    bpy.app.handlers.depsgraph_update_post.append(depsgraph_handler)
     bpy.app.handlers.undo_post.append(on_undo_redo_handler)
     bpy.app.handlers.redo_post.append(on_undo_redo_handler)
     atexit.register(on_exit_handler)
@@ -154,6 +220,7 @@ def unregister():
     
     bpy.app.handlers.undo_post.remove(on_undo_redo_handler)
     bpy.app.handlers.redo_post.remove(on_undo_redo_handler)
+    # no longer registered, but an older version of the add-on may have left it in the list
     if depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(depsgraph_handler)
     bpy.app.handlers.load_post.remove(on_load_handler)
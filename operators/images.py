@@ -1,6 +1,9 @@
 import bpy
 from bpy_extras.io_utils import ImportHelper
+import functools
 import os
+import re
+import stat
 
 from . import utils_paint
 from .. import utils, constants
@@ -8,6 +11,30 @@ from ..operators import utils_operator
 from ..data.materials.layers.layer_types import layer_fill
 
 
+# matches a file extension at the end of a path, dots in folder names don't count
+EXTENSION_RE = re.compile(r"\.[^.\\/]+\Z")
+
+def clear_caches():
+    """ clears the cached file checks """
+    validate_file.cache_clear()
+
+
+# only successful checks are cached since lru_cache doesn't store raised errors,
+# so a path that was missing or invalid is checked again on the next import
+@functools.lru_cache(maxsize=256)
+def validate_file(filepath):
+    """ raises a RuntimeError if filepath isn't an existing regular file, classified from a single stat call """
+    try:
+        mode = os.stat(filepath).st_mode
+    except OSError as e:
+        raise RuntimeError(f"Image file does not exist: {filepath} ({e.strerror})") from e
+    if stat.S_ISDIR(mode):
+        raise RuntimeError(f"Path is a directory, not an image file: {filepath}")
+    if not stat.S_ISREG(mode):
+        raise RuntimeError(f"Path is not a regular file: {filepath}")
+    return True
+
+
 def import_image(filepath):
     """Opens image from given path and saves it in folder next to blend file.
     
@@ -18,14 +45,18 @@ def import_image(filepath):
         Loaded and saved image object.
     
     Raises:
-        FileNotFoundError: If image file doesn't exist.
-        RuntimeError: If image load or save fails.
+        RuntimeError: If the path isn't an existing file or image load or save fails.
     """
     try:
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Image file not found: {filepath}")
+        validate_file(filepath)
         
-        img = bpy.data.images.load(filepath)
+        try:
+            img = bpy.data.images.load(filepath)
+        except RuntimeError:
+            # the cached check may be stale if the file went away since, recheck just this path
+            # uncached for a precise message instead of dropping every other cached check
+            validate_file.__wrapped__(filepath)
+            raise
         if not img:
             raise RuntimeError(f"Blender failed to load image: {filepath}")
         
@@ -49,10 +80,9 @@ def load_filepath_in_node(node, filepath, non_color):
     if not filepath:
         return
     
-    if not os.path.exists(filepath):
-        raise RuntimeError(f"Image file does not exist: {filepath}")
+    validate_file(filepath)
     
-    if "." not in filepath:
+    if not EXTENSION_RE.search(filepath):
         raise RuntimeError(f"Invalid filename (no extension): {filepath}")
     
     try:
@@ -89,6 +119,13 @@ class LP_OT_OpenImage(bpy.types.Operator, ImportHelper):
         return utils_operator.base_poll(context)
 
     def execute(self, context):
+        if not self.filepath:
+            self.report({'ERROR'}, "No image file selected.")
+            return {'CANCELLED'}
+        if not EXTENSION_RE.search(self.filepath):
+            self.report({'ERROR'}, f"Invalid filename (no extension): {self.filepath}")
+            return {'CANCELLED'}
+        
         try:
             ntree = bpy.data.node_groups.get(self.node_tree)
             if not ntree:
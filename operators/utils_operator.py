@@ -9,8 +9,9 @@ def base_poll(context):
 
 def get_input(material_name, node_name, input_name):
     """ function to get an input from keys. Returns None if not found """
-    if material_name in bpy.data.materials:
-        if node_name in bpy.data.materials[material_name].node_tree.nodes:
-            if input_name in bpy.data.materials[material_name].node_tree.nodes[node_name].inputs:
-                return bpy.data.materials[material_name].node_tree.nodes[node_name].inputs[input_name]
+    mat = bpy.data.materials.get(material_name)
+    if mat and mat.node_tree:
+        node = mat.node_tree.nodes.get(node_name)
+        if node:
+            return node.inputs.get(input_name)
     return None
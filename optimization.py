@@ -28,13 +28,23 @@ Usage:
 
 import time
 import functools
-from typing import Dict, List, Optional, Callable, Any, Tuple
-from collections import OrderedDict
+import heapq
+import operator
+from typing import Dict, List, Optional, Callable, Any, Tuple, Hashable, Deque, Iterable
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
 import gc
 
+try:
+    import psutil
+    _HAS_PSUTIL = True
+    _PROCESS = psutil.Process()
+except ImportError:
+    _HAS_PSUTIL = False
+    _PROCESS = None
+
 
 # ============================================================================
 # Caching System
@@ -43,7 +53,7 @@ import gc
 @dataclass
 class CacheEntry:
     """Single cache entry with metadata."""
-    key: str
+    key: Hashable
     value: Any
     timestamp: float
     access_count: int = 0
@@ -66,18 +76,18 @@ class CacheManager:
         self.name = name
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, CacheEntry] = OrderedDict()
+        self.cache: Dict[Hashable, CacheEntry] = OrderedDict()
         self.hits = 0
         self.misses = 0
         self.current_size_bytes = 0
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
     
-    def get(self, key: str, compute_fn: Optional[Callable] = None) -> Any:
+    def get(self, key: Hashable, compute_fn: Optional[Callable] = None) -> Any:
         """
         Get value from cache or compute if missing.
         
         Args:
-            key (str): Cache key
+            key (hashable): Cache key
             compute_fn (callable): Function to compute value if missing
         
         Returns:
@@ -107,12 +117,12 @@ class CacheManager:
             self.set(key, value)
             return value
     
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """
         Set cache entry.
         
         Args:
-            key (str): Cache key
+            key (hashable): Cache key
             value: Value to cache
         """
         with self._lock:
@@ -123,7 +133,7 @@ class CacheManager:
             # Calculate size
             try:
                 size = len(str(value).encode('utf-8'))
-            except:
+            except Exception:
                 size = 0
             
             # Check capacity
@@ -142,7 +152,7 @@ class CacheManager:
             self.cache[key] = entry
             self.current_size_bytes += size
     
-    def invalidate(self, key: str) -> None:
+    def invalidate(self, key: Hashable) -> None:
         """Invalidate specific cache entry."""
         with self._lock:
             if key in self.cache:
@@ -154,12 +164,12 @@ class CacheManager:
             self.cache.clear()
             self.current_size_bytes = 0
     
-    def _remove_entry(self, key: str) -> None:
+    def _remove_entry(self, key: Hashable) -> None:
         """Remove entry and update size."""
         entry = self.cache.pop(key)
         self.current_size_bytes -= entry.size_bytes
     
-    def _get_lru_key(self) -> str:
+    def _get_lru_key(self) -> Hashable:
         """Get least recently used key."""
         lru_key = min(self.cache.keys(), 
                      key=lambda k: self.cache[k].last_accessed)
@@ -220,6 +230,8 @@ class BatchProcessor:
         self.batch_size = batch_size
         self.defer_execution = defer_execution
         self.operations: List[BatchOperation] = []
+        # Zero-argument callables grouped by target id, built once in add()
+        self._thunks: Dict[int, List[Callable[[], Any]]] = {}
         self.executed_count = 0
     
     def add(self, target: Any, operation: str, *args, **kwargs) -> None:
@@ -234,51 +246,70 @@ class BatchProcessor:
         """
         op = BatchOperation(target, operation, args, kwargs)
         self.operations.append(op)
+        self._thunks.setdefault(id(target), []).append(self._make_thunk(op))
+        
+        # Auto-execute if batch full
+        if not self.defer_execution and len(self.operations) >= self.batch_size:
+            self.execute()
+    
+    def extend(self, ops: Iterable[BatchOperation]) -> None:
+        """
+        Add several prepared operations to batch.
+        
+        The batch size is checked once for the whole group rather than
+        after every operation.
+        
+        Args:
+            ops (iterable): BatchOperation instances to queue
+        """
+        ops = list(ops)
+        self.operations.extend(ops)
+        
+        thunks = self._thunks
+        make_thunk = self._make_thunk
+        for op in ops:
+            thunks.setdefault(id(op.target), []).append(make_thunk(op))
         
         # Auto-execute if batch full
         if not self.defer_execution and len(self.operations) >= self.batch_size:
             self.execute()
     
+    @staticmethod
+    def _make_thunk(op: BatchOperation) -> Callable[[], Any]:
+        """Resolve operation dispatch once and bind its arguments."""
+        if callable(op.operation):
+            return functools.partial(op.operation, op.target, *op.args, **op.kwargs)
+        return functools.partial(getattr(op.target, op.operation), *op.args, **op.kwargs)
+    
     def execute(self) -> int:
         """
         Execute all operations in batch.
         
+        Operations are grouped by target for cache locality.
+        
         Returns:
             Number of operations executed
         """
         if not self.operations:
             return 0
         
+        # Swap the queues out first, so operations that queue more work while
+        # running land in fresh queues for the next execute()
+        thunks_by_target, self._thunks = self._thunks, {}
+        self.operations = []
+        
         executed = 0
         try:
-            # Group operations by target for cache locality
-            ops_by_target = {}
-            for op in self.operations:
-                target_id = id(op.target)
-                if target_id not in ops_by_target:
-                    ops_by_target[target_id] = []
-                ops_by_target[target_id].append(op)
-            
-            # Execute grouped operations
-            for ops_group in ops_by_target.values():
-                for op in ops_group:
-                    self._execute_operation(op)
+            for thunks in thunks_by_target.values():
+                for fn in thunks:
+                    fn()
                     executed += 1
         
         finally:
-            self.operations.clear()
             self.executed_count += executed
         
         return executed
     
-    def _execute_operation(self, op: BatchOperation) -> None:
-        """Execute single operation."""
-        if callable(op.operation):
-            op.operation(op.target, *op.args, **op.kwargs)
-        else:
-            method = getattr(op.target, op.operation)
-            method(*op.args, **op.kwargs)
-    
     def get_pending_count(self) -> int:
         """Get count of pending operations."""
         return len(self.operations)
@@ -286,6 +317,7 @@ class BatchProcessor:
     def clear(self) -> None:
         """Clear pending operations without executing."""
         self.operations.clear()
+        self._thunks.clear()
 
 
 # ============================================================================
@@ -302,11 +334,56 @@ class ProfileResult:
     memory_delta_mb: float
 
 
+@dataclass
+class ProfileStats:
+    """Running aggregate of all measurements recorded under one name."""
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_mem_delta_mb: float = 0.0
+    peak_mem_delta_mb: float = 0.0
+    
+    @property
+    def mean_ms(self) -> float:
+        """Average duration per call."""
+        return self.total_ms / self.count if self.count else 0.0
+    
+    def add(self, result: ProfileResult) -> None:
+        """Fold a single measurement into the aggregate."""
+        self.count += 1
+        self.total_ms += result.duration_ms
+        self.total_mem_delta_mb += result.memory_delta_mb
+        if result.duration_ms > self.max_ms:
+            self.max_ms = result.duration_ms
+        if self.count == 1 or result.memory_delta_mb > self.peak_mem_delta_mb:
+            self.peak_mem_delta_mb = result.memory_delta_mb
+
+
 class PerformanceProfiler:
-    """Profile code execution and memory usage."""
+    """
+    Profile code execution and memory usage.
+    
+    Measurements are stored as a delta profile: one running aggregate per
+    name plus a bounded window of the most recent raw samples. Keeping every
+    sample would grow without limit over a long Blender session, while the
+    aggregates cost O(unique names) memory and constant time per update.
+    """
     
-    def __init__(self):
-        self.results: List[ProfileResult] = []
+    _SLOWEST_ROW = "  {name:40} {max_ms:8.2f}ms Calls: {count:5d} Mem: {peak_mem_delta_mb:+6.2f}MB"
+    _MEMORY_ROW = "  {name:40} {peak_mem_delta_mb:+8.2f}MB Time: {max_ms:7.2f}ms"
+    
+    def __init__(self, recent_cap: Optional[int] = None):
+        """
+        Create profiler.
+        
+        Args:
+            recent_cap (int): Number of raw samples to keep for drill-down
+        """
+        if recent_cap is None:
+            recent_cap = OptimizationSettings.PROFILE_RECENT_CAP
+        self.stats: Dict[str, ProfileStats] = {}
+        self.recent: Deque[ProfileResult] = deque(maxlen=recent_cap)
     
     def profile(self, name: str, fn: Callable) -> Any:
         """
@@ -337,32 +414,40 @@ class PerformanceProfiler:
                 memory_mb_after=mem_after,
                 memory_delta_mb=mem_after - mem_before
             )
-            self.results.append(profile_result)
+            self.record(profile_result)
         
         return result
     
+    def record(self, result: ProfileResult) -> None:
+        """Add a measurement to the aggregates and the recent window."""
+        stats = self.stats.get(result.name)
+        if stats is None:
+            stats = self.stats[result.name] = ProfileStats(result.name)
+        stats.add(result)
+        self.recent.append(result)
+    
+    def clear(self) -> None:
+        """Discard all recorded measurements."""
+        self.stats.clear()
+        self.recent.clear()
+    
     def _get_memory_mb(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss / (1024 * 1024)
-        except:
+        if not _HAS_PSUTIL:
             return 0.0
+        return _PROCESS.memory_info().rss / (1024 * 1024)
     
-    def get_slowest(self, count: int = 5) -> List[ProfileResult]:
-        """Get slowest operations."""
-        return sorted(self.results, key=lambda r: r.duration_ms, reverse=True)[:count]
+    def get_slowest(self, count: int = 5) -> List[ProfileStats]:
+        """Get operations with the slowest single call."""
+        return heapq.nlargest(count, self.stats.values(), key=operator.attrgetter('max_ms'))
     
-    def get_memory_hogs(self, count: int = 5) -> List[ProfileResult]:
-        """Get operations using most memory."""
-        return sorted(self.results, 
-                     key=lambda r: r.memory_delta_mb, 
-                     reverse=True)[:count]
+    def get_memory_hogs(self, count: int = 5) -> List[ProfileStats]:
+        """Get operations with the largest single memory increase."""
+        return heapq.nlargest(count, self.stats.values(), key=operator.attrgetter('peak_mem_delta_mb'))
     
     def report(self) -> str:
         """Generate profiling report."""
-        if not self.results:
+        if not self.stats:
             return "No profile results"
         
         lines = [
@@ -372,11 +457,16 @@ class PerformanceProfiler:
             ""
         ]
         
-        # Summary
-        total_time = sum(r.duration_ms for r in self.results)
-        total_memory = sum(r.memory_delta_mb for r in self.results)
+        # Summary (single pass over the aggregates)
+        total_count = 0
+        total_time = 0.0
+        total_memory = 0.0
+        for stats in self.stats.values():
+            total_count += stats.count
+            total_time += stats.total_ms
+            total_memory += stats.total_mem_delta_mb
         
-        lines.append(f"Total measurements: {len(self.results)}")
+        lines.append(f"Total measurements: {total_count}")
         lines.append(f"Total time: {total_time:.1f}ms")
         lines.append(f"Total memory delta: {total_memory:.2f}MB")
         lines.append("")
@@ -384,21 +474,15 @@ class PerformanceProfiler:
         # Slowest operations
         lines.append("Slowest operations:")
         lines.append("-" * 70)
-        for result in self.get_slowest(5):
-            lines.append(
-                f"  {result.name:40} {result.duration_ms:8.2f}ms "
-                f"Mem: {result.memory_delta_mb:+6.2f}MB"
-            )
+        fmt = self._SLOWEST_ROW.format_map
+        lines.extend(fmt(vars(stats)) for stats in self.get_slowest(5))
         
         # Memory hogs
         lines.append("")
         lines.append("Most memory usage:")
         lines.append("-" * 70)
-        for result in self.get_memory_hogs(5):
-            lines.append(
-                f"  {result.name:40} {result.memory_delta_mb:+8.2f}MB "
-                f"Time: {result.duration_ms:7.2f}ms"
-            )
+        fmt = self._MEMORY_ROW.format_map
+        lines.extend(fmt(vars(stats)) for stats in self.get_memory_hogs(5))
         
         lines.append("")
         lines.append("=" * 70)
@@ -428,7 +512,12 @@ def memoize(cache_manager: Optional[CacheManager] = None) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Create cache key from args
-            cache_key = f"{func.__name__}_{str(args)}_{str(kwargs)}"
+            cache_key = (func.__qualname__, args, tuple(sorted(kwargs.items())) if kwargs else ())
+            try:
+                hash(cache_key)
+            except TypeError:
+                # Unhashable arguments can't be cached
+                return func(*args, **kwargs)
             
             def compute():
                 return func(*args, **kwargs)
@@ -468,6 +557,9 @@ def profile_performance(profiler: Optional[PerformanceProfiler] = None) -> Calla
     """
     Decorator to profile function.
     
+    Calls pass straight through while OptimizationSettings.ENABLE_PROFILING
+    is False.
+    
     Args:
         profiler (PerformanceProfiler): Profiler to use (optional)
     
@@ -481,6 +573,9 @@ def profile_performance(profiler: Optional[PerformanceProfiler] = None) -> Calla
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # Profiling is off in normal use, so skip the gc/psutil work entirely
+            if not OptimizationSettings.ENABLE_PROFILING:
+                return func(*args, **kwargs)
             return prof.profile(func.__name__, lambda: func(*args, **kwargs))
         
         wrapper.get_profile = lambda: prof
@@ -510,14 +605,12 @@ def optimize_batch_operations(operations: List[Tuple]) -> int:
         ]
         optimize_batch_operations(ops)
     """
-    processor = BatchProcessor()
-    
-    for op_tuple in operations:
-        target = op_tuple[0]
-        operation = op_tuple[1]
-        args = op_tuple[2:] if len(op_tuple) > 2 else ()
-        
-        processor.add(target, operation, *args)
+    # Deferred so the whole list runs as one batch instead of auto-executing midway
+    processor = BatchProcessor(defer_execution=True)
+    processor.extend([
+        BatchOperation(target, operation, tuple(args))
+        for target, operation, *args in operations
+    ])
     
     return processor.execute()
 
@@ -551,27 +644,25 @@ class MemoryOptimizer:
         """
         try:
             import bpy
-            for image in bpy.data.images:
-                if image.size[0] > max_resolution or image.size[1] > max_resolution:
-                    # Schedule for reload at lower resolution
-                    pass
-        except:
-            pass
+        except ImportError:
+            return
+        
+        for image in bpy.data.images:
+            if image.size[0] > max_resolution or image.size[1] > max_resolution:
+                # Schedule for reload at lower resolution
+                pass
     
     @staticmethod
     def get_memory_usage() -> Dict[str, float]:
         """Get detailed memory usage."""
-        try:
-            import psutil
-            process = psutil.Process()
-            mem_info = process.memory_info()
-            return {
-                "rss_mb": mem_info.rss / (1024 * 1024),
-                "vms_mb": mem_info.vms / (1024 * 1024),
-                "percent": process.memory_percent(),
-            }
-        except:
+        if not _HAS_PSUTIL:
             return {}
+        mem_info = _PROCESS.memory_info()
+        return {
+            "rss_mb": mem_info.rss / (1024 * 1024),
+            "vms_mb": mem_info.vms / (1024 * 1024),
+            "percent": _PROCESS.memory_percent(),
+        }
 
 
 # ============================================================================
@@ -597,6 +688,7 @@ class OptimizationSettings:
     # Profiling
     ENABLE_PROFILING = False
     PROFILE_SLOW_THRESHOLD_MS = 100
+    PROFILE_RECENT_CAP = 1000
     
     @classmethod
     def get_cache_config(cls) -> Dict[str, Any]:
@@ -622,21 +714,29 @@ class OptimizationSettings:
 
 _cache_managers: Dict[str, CacheManager] = {}
 _profiler = None
+_profiler_lock = threading.Lock()
 
 def get_cache(name: str) -> CacheManager:
     """Get or create named cache."""
-    if name not in _cache_managers:
+    mgr = _cache_managers.get(name)
+    if mgr is None:
+        # setdefault is atomic, so concurrent callers all end up with the same instance
         config = OptimizationSettings.get_cache_config()
-        _cache_managers[name] = CacheManager(
+        mgr = CacheManager(
             name,
             max_size_mb=config["max_size_mb"],
             ttl_seconds=config["ttl_seconds"]
         )
-    return _cache_managers[name]
+        mgr = _cache_managers.setdefault(name, mgr)
+    return mgr
 
 def get_profiler() -> PerformanceProfiler:
     """Get global profiler."""
     global _profiler
-    if _profiler is None:
-        _profiler = PerformanceProfiler()
-    return _profiler
+    prof = _profiler
+    if prof is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = PerformanceProfiler()
+            prof = _profiler
+    return prof
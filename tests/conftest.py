@@ -10,11 +10,13 @@ import bpy
 import pytest
 import os
 import tempfile
+from contextlib import contextmanager, suppress
 from typing import Optional
 
 
 class BlenderTestContext:
     """Helper class to manage Blender test state."""
+    __slots__ = ('materials_created', 'objects_created', 'temp_files')
     
     def __init__(self):
         """Initialize test context with clean Blender scene."""
@@ -63,7 +65,8 @@ class BlenderTestContext:
     
     def create_duplicate_material(self, original: bpy.types.Material) -> bpy.types.Material:
         """Duplicate a material for testing UID sync."""
-        # Use Blender's built-in duplication
+        # ID.copy() duplicates the datablock directly (named "<original>.001", ".002", ...)
+        # without the operator, undo push and context setup of bpy.ops.material.copy()
         duplicate = original.copy()
         self.materials_created.append(duplicate)
         return duplicate
@@ -75,6 +78,12 @@ class BlenderTestContext:
             pass
         return mat
     
+    def forget(self, ids):
+        """Stop tracking the given datablocks, call before removing them so no reference to freed data is kept."""
+        pointers = {id_data.as_pointer() for id_data in ids}
+        self.objects_created[:] = [o for o in self.objects_created if o.as_pointer() not in pointers]
+        self.materials_created[:] = [m for m in self.materials_created if m.as_pointer() not in pointers]
+    
     def cleanup(self):
         """Clean up all created test resources."""
         # Remove objects
@@ -89,21 +98,83 @@ class BlenderTestContext:
         
         # Clean up temp files
         for filepath in self.temp_files:
-            try:
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-            except OSError:
-                pass
+            with suppress(OSError):
+                os.remove(filepath)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def blender_context():
-    """Fixture providing clean Blender test context."""
+    """Fixture providing a Blender test context shared by all tests in a module."""
     ctx = BlenderTestContext()
     yield ctx
     ctx.cleanup()
 
 
+@pytest.fixture(scope="session")
+def handlers():
+    """Fixture providing the add-on's handlers module, imported once per session."""
+    from layer_painter import handlers as handlers_module
+    return handlers_module
+
+
+@pytest.fixture(scope="session")
+def _verify_cache_modules():
+    """Checks once per session that the material caches the handlers clear exist.
+    Blender test modules opt in with pytestmark, see BLENDER_FIXTURES."""
+    from layer_painter.data.materials.channels import channel
+    from layer_painter.data.materials.layers import layer
+    assert hasattr(channel, 'cached_materials'), "channel cache should exist"
+    assert hasattr(layer, 'cached_materials'), "layer cache should exist"
+
+
+@pytest.fixture
+def _remove_test_data(handlers, blender_context):
+    """Removes objects and materials created during each test so the module-scoped context stays clean."""
+    objects_snapshot = set(bpy.data.objects.keys())
+    meshes_snapshot = set(bpy.data.meshes.keys())
+    materials_snapshot = set(bpy.data.materials.keys())
+    yield
+    new_objects = [bpy.data.objects[name] for name in set(bpy.data.objects.keys()) - objects_snapshot]
+    new_meshes = [bpy.data.meshes[name] for name in set(bpy.data.meshes.keys()) - meshes_snapshot]
+    new_materials = [bpy.data.materials[name] for name in set(bpy.data.materials.keys()) - materials_snapshot]
+    # remove() only invalidates the reference it's given, the context's copies would point at freed data
+    blender_context.forget(new_objects + new_materials)
+    # objects first, they hold the meshes and material slots
+    for obj in new_objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in new_meshes:
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+    for mat in new_materials:
+        bpy.data.materials.remove(mat, do_unlink=True)
+    
+    handlers._invalidate_fingerprint()
+
+
+# fixtures every Blender test module applies with pytestmark = BLENDER_FIXTURES,
+# kept out of autouse so the pure Python tests don't touch bpy
+BLENDER_FIXTURES = pytest.mark.usefixtures("_verify_cache_modules", "_remove_test_data")
+
+
+@pytest.fixture(scope="module")
+def many_materials(blender_context):
+    """Fixture providing 50 materials shared by all tests in a module, so setup stays out of timed code."""
+    with suspend_depsgraph_handlers():
+        return tuple(blender_context.create_material(f"LP_Pool_{i:03d}") for i in range(50))
+
+
+@pytest.fixture(scope="session")
+def valid_png_path(tmp_path_factory):
+    """Fixture providing the path of a 32x32 PNG that is written once per session."""
+    try:
+        from PIL import Image
+    except ImportError:
+        pytest.skip("PIL not available")
+    
+    path = tmp_path_factory.mktemp("images") / "valid.png"
+    Image.new('RGB', (32, 32), color=(255, 0, 0)).save(path)
+    return str(path)
+
+
 @pytest.fixture
 def test_material(blender_context):
     """Fixture providing a test material with nodes enabled."""
@@ -127,6 +198,43 @@ def active_blender_context(test_mesh_object):
     return test_mesh_object
 
 
+class ReportCollector:
+    """Stand-in for Operator.report that records (level_set, message) calls."""
+    __slots__ = ('reports',)
+    
+    def __init__(self):
+        self.reports = []
+    
+    def __call__(self, level_set, message):
+        self.reports.append((level_set, message))
+    
+    def errors(self):
+        """Returns the recorded reports with ERROR level."""
+        return [r for r in self.reports if 'ERROR' in r[0]]
+    
+    def clear(self):
+        """Forgets all recorded reports."""
+        self.reports.clear()
+
+
+@pytest.fixture
+def capture_report():
+    """Fixture providing a ReportCollector to assign to operator.report."""
+    return ReportCollector()
+
+
+@contextmanager
+def suspend_depsgraph_handlers():
+    """Temporarily removes all depsgraph_update_post handlers, e.g. while bulk-creating data."""
+    handlers = bpy.app.handlers.depsgraph_update_post
+    saved = list(handlers)
+    handlers.clear()
+    try:
+        yield
+    finally:
+        handlers[:] = saved
+
+
 def assert_material_has_uid(material: bpy.types.Material) -> bool:
     """Assert that material has valid LP UID."""
     assert hasattr(material, 'lp'), f"Material {material.name} missing lp property"
@@ -150,3 +258,9 @@ def assert_operator_failed(result: dict):
 def assert_operator_succeeded(result: dict):
     """Assert operator returned FINISHED."""
     assert result == {"FINISHED"}, f"Expected FINISHED, got {result}"
+
+
+def assert_operator_terminated(result: dict):
+    """Assert operator returned either FINISHED or CANCELLED."""
+    assert result == {"FINISHED"} or result == {"CANCELLED"}, \
+        f"Expected FINISHED or CANCELLED, got {result}"
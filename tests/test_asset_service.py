@@ -0,0 +1,80 @@
+import sys
+import types
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Dynamically import asset_service from the add-on package, without running the
+# package __init__ files, which need bpy
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "layer_painter"
+for name, path in (
+    (PACKAGE, ROOT),
+    (f"{PACKAGE}.ui", ROOT / "ui"),
+    (f"{PACKAGE}.ui.viewport", ROOT / "ui" / "viewport"),
+    (f"{PACKAGE}.ui.viewport.assets", ROOT / "ui" / "viewport" / "assets"),
+):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
+
+MODULE_NAME = f"{PACKAGE}.ui.viewport.assets.asset_service"
+MODULE_PATH = ROOT / "ui" / "viewport" / "assets" / "asset_service.py"
+spec = importlib.util.spec_from_file_location(MODULE_NAME, str(MODULE_PATH))
+asset_service = importlib.util.module_from_spec(spec)
+sys.modules[MODULE_NAME] = asset_service
+spec.loader.exec_module(asset_service)
+
+
+class TestAssetService(unittest.TestCase):
+    def setUp(self):
+        asset_service.clear_caches()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+
+    def tearDown(self):
+        asset_service.clear_caches()
+        self.tmp.cleanup()
+
+    def test_asset_manager_class_importable(self):
+        cls = asset_service.get_asset_manager_class()
+        self.assertIsNotNone(cls)
+        self.assertEqual(cls.__name__, "AssetManager")
+
+    def test_manager_reused_until_registry_changes(self):
+        mgr = asset_service.get_manager(self.base_dir)
+        self.assertIs(asset_service.get_manager(self.base_dir), mgr)
+
+        AssetType = sys.modules[f"{PACKAGE}.assets_extended"].AssetType
+        mgr.register_asset(name="Walnut Wood", asset_type=AssetType.MATERIAL)
+        mgr.save_registry()
+
+        reloaded = asset_service.get_manager(self.base_dir)
+        self.assertIsNot(reloaded, mgr)
+        self.assertEqual(len(reloaded.assets), 1)
+
+    def test_managers_cached_per_directory(self):
+        with tempfile.TemporaryDirectory() as other_dir:
+            mgr = asset_service.get_manager(self.base_dir)
+            other = asset_service.get_manager(other_dir)
+            self.assertIsNot(mgr, other)
+
+            # a change in one project doesn't reload the other's manager
+            other.save_registry()
+            self.assertIsNot(asset_service.get_manager(other_dir), other)
+            self.assertIs(asset_service.get_manager(self.base_dir), mgr)
+
+    def test_stats_cached_while_manager_unchanged(self):
+        stats = asset_service.get_stats(self.base_dir)
+        self.assertEqual(stats["total_assets"], 0)
+        self.assertIs(asset_service.get_stats(self.base_dir), stats)
+
+    def test_export_first_empty_library(self):
+        with tempfile.TemporaryDirectory() as export_dir:
+            self.assertIsNone(asset_service.export_first(export_dir, self.base_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
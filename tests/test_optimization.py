@@ -0,0 +1,138 @@
+import threading
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Dynamically import optimization from repository root
+ROOT = Path(__file__).resolve().parent.parent
+MODULE_PATH = ROOT / "optimization.py"
+spec = importlib.util.spec_from_file_location("optimization", str(MODULE_PATH))
+optimization = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(optimization)
+
+
+class TestBatchProcessor(unittest.TestCase):
+    def test_operation_queueing_more_work_during_execute(self):
+        processor = optimization.BatchProcessor(defer_execution=True)
+        calls = []
+
+        def follow_up(target):
+            calls.append(("follow_up", target))
+
+        def queue_more(target):
+            calls.append(("queue_more", target))
+            processor.add("other_target", follow_up)
+
+        processor.add("target", queue_more)
+
+        self.assertEqual(processor.execute(), 1)
+        self.assertEqual(calls, [("queue_more", "target")])
+        # the work queued while executing stays pending for the next run
+        self.assertEqual(processor.get_pending_count(), 1)
+        self.assertEqual(processor.execute(), 1)
+        self.assertEqual(calls[-1], ("follow_up", "other_target"))
+        self.assertEqual(processor.get_pending_count(), 0)
+
+
+class TestCacheManager(unittest.TestCase):
+    def test_get_computes_on_miss(self):
+        cache = optimization.CacheManager("test")
+        result = []
+        # get() calls set() under the same lock, run it in a thread so a deadlock fails instead of hanging
+        worker = threading.Thread(target=lambda: result.append(cache.get("key", lambda: 42)), daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        self.assertFalse(worker.is_alive(), "get() with compute_fn did not return")
+        self.assertEqual(result, [42])
+        self.assertEqual(cache.get("key"), 42)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+class TestMemoize(unittest.TestCase):
+    def test_repeated_calls_compute_once(self):
+        calls = []
+
+        @optimization.memoize(optimization.CacheManager("test"))
+        def scale(x, factor=1):
+            calls.append((x, factor))
+            return x * factor
+
+        self.assertEqual(scale(2, factor=3), 6)
+        self.assertEqual(scale(2, factor=3), 6)
+        self.assertEqual(scale(2), 2)
+        self.assertEqual(calls, [(2, 3), (2, 1)])
+
+    def test_unhashable_arguments_bypass_cache(self):
+        cache = optimization.CacheManager("test")
+        calls = []
+
+        @optimization.memoize(cache)
+        def total(values):
+            calls.append(values)
+            return sum(values)
+
+        self.assertEqual(total([1, 2]), 3)
+        self.assertEqual(total([1, 2]), 3)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(cache.cache), 0)
+
+
+class TestPerformanceProfiler(unittest.TestCase):
+    @staticmethod
+    def sample(name, duration_ms, mem_delta_mb):
+        return optimization.ProfileResult(
+            name=name,
+            duration_ms=duration_ms,
+            memory_mb_before=100.0,
+            memory_mb_after=100.0 + mem_delta_mb,
+            memory_delta_mb=mem_delta_mb
+        )
+
+    def test_record_aggregates_by_name(self):
+        profiler = optimization.PerformanceProfiler(recent_cap=3)
+        for duration, mem in ((10.0, 1.0), (30.0, -2.0), (20.0, 4.0)):
+            profiler.record(self.sample("bake", duration, mem))
+        profiler.record(self.sample("load", 5.0, 0.5))
+        profiler.record(self.sample("load", 15.0, 0.25))
+
+        bake = profiler.stats["bake"]
+        self.assertEqual(bake.count, 3)
+        self.assertAlmostEqual(bake.total_ms, 60.0)
+        self.assertAlmostEqual(bake.max_ms, 30.0)
+        self.assertAlmostEqual(bake.mean_ms, 20.0)
+        self.assertAlmostEqual(bake.peak_mem_delta_mb, 4.0)
+        load = profiler.stats["load"]
+        self.assertEqual(load.count, 2)
+        self.assertAlmostEqual(load.total_ms, 20.0)
+        self.assertAlmostEqual(load.max_ms, 15.0)
+        self.assertAlmostEqual(load.peak_mem_delta_mb, 0.5)
+
+        self.assertLessEqual(len(profiler.recent), 3)
+        self.assertEqual([r.name for r in profiler.recent], ["bake", "load", "load"])
+        self.assertEqual([s.name for s in profiler.get_slowest(1)], ["bake"])
+        self.assertEqual([s.name for s in profiler.get_memory_hogs(2)], ["bake", "load"])
+
+    def test_report_renders_rows(self):
+        profiler = optimization.PerformanceProfiler(recent_cap=2)
+        profiler.record(self.sample("bake", 12.5, 1.5))
+        profiler.record(self.sample("load", 3.0, -0.5))
+
+        report = profiler.report()
+        self.assertIn("Total measurements: 2", report)
+        self.assertIn("Total time: 15.5ms", report)
+        rows = [line for line in report.splitlines() if line.startswith("  ")]
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(rows[0].lstrip().startswith("bake"))
+        self.assertIn("12.50ms Calls:     1", rows[0])
+
+    def test_clear(self):
+        profiler = optimization.PerformanceProfiler(recent_cap=2)
+        profiler.record(self.sample("bake", 1.0, 0.0))
+        profiler.clear()
+        self.assertEqual(profiler.stats, {})
+        self.assertEqual(len(profiler.recent), 0)
+        self.assertEqual(profiler.report(), "No profile results")
+
+
+if __name__ == "__main__":
+    unittest.main()
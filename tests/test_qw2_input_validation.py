@@ -10,206 +10,80 @@ Validates that:
 
 import pytest
 import bpy
+from layer_painter.operators import layers as layers_module, channels as channels_module, paint as paint_module
 from conftest import (
     BlenderTestContext,
     assert_operator_failed,
     assert_operator_succeeded,
-    assert_material_has_uid
+    assert_operator_terminated,
+    assert_material_has_uid,
+    BLENDER_FIXTURES,
 )
 
 
-class MockOperator:
-    """Mock operator for testing validation patterns."""
-    
-    def __init__(self):
-        self.reports = []
-    
-    def report(self, level_set, message):
-        """Capture report calls for verification."""
-        self.reports.append((level_set, message))
-
-
-class TestQW2LayerOperatorValidation:
-    """Test input validation in layer operators."""
-    
-    def test_add_fill_layer_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_AddFillLayer should validate material exists."""
-        from layer_painter.operators import layers as layers_module
-        
-        operator = layers_module.LP_OT_AddFillLayer()
-        operator.report = MockOperator().report
-        
-        # Set material to non-existent name
+pytestmark = BLENDER_FIXTURES
+
+
+# (operator module, operator class name, extra properties) for operators that
+# must cancel when their material can't be found
+VALIDATION_CASES = [
+    pytest.param(layers_module, "LP_OT_AddFillLayer", {}, id="add_fill_layer"),
+    pytest.param(layers_module, "LP_OT_RemoveLayer", {"uid": "aaaaaaaaaa"}, id="remove_layer"),
+    pytest.param(layers_module, "LP_OT_MoveLayerUp", {"uid": "aaaaaaaaaa"}, id="move_layer_up"),
+    pytest.param(layers_module, "LP_OT_MoveLayerDown", {"uid": "aaaaaaaaaa"}, id="move_layer_down"),
+    pytest.param(layers_module, "LP_OT_CycleChannelData",
+                 {"layer": "aaaaaaaaaa", "channel": "bbbbbbbbbb"}, id="cycle_channel_data"),
+    pytest.param(channels_module, "LP_OT_MakeChannel",
+                 {"node": "SomeNode", "input": "SomeInput"}, id="make_channel"),
+    pytest.param(channels_module, "LP_OT_RemoveChannel", {"channel": "aaaaaaaaaa"}, id="remove_channel"),
+    pytest.param(channels_module, "LP_OT_MoveChannelUp", {"channel": "aaaaaaaaaa"}, id="move_channel_up"),
+    pytest.param(channels_module, "LP_OT_MoveChannelDown", {"channel": "aaaaaaaaaa"}, id="move_channel_down"),
+    pytest.param(paint_module, "LP_OT_PaintChannel",
+                 {"layer": "aaaaaaaaaa", "channel": "bbbbbbbbbb"}, id="paint_channel"),
+    pytest.param(paint_module, "LP_OT_ToggleTexture",
+                 {"layer": "aaaaaaaaaa", "channel": "bbbbbbbbbb"}, id="toggle_texture"),
+]
+
+
+class TestQW2OperatorValidation:
+    """Test input validation in layer, channel and paint operators."""
+    
+    @pytest.mark.parametrize("module,cls_name,extra", VALIDATION_CASES)
+    def test_missing_material_cancels(self, blender_context, active_blender_context, module, cls_name, extra, capture_report):
+        """Operators should cancel gracefully when their material doesn't exist."""
+        operator = getattr(module, cls_name)()
+        operator.report = capture_report
         operator.material = "NonExistentMaterial"
+        for attr, value in extra.items():
+            setattr(operator, attr, value)
         
-        # Execute should fail gracefully
         result = operator.execute(bpy.context)
         
-        # Should return CANCELLED
         assert_operator_failed(result)
-        # Should have error report
-        assert len(operator.report.__self__.reports) > 0
     
-    def test_add_fill_layer_succeeds_with_valid_material(self, blender_context, active_blender_context):
-        """LP_OT_AddFillLayer should succeed with valid material."""
-        from layer_painter.operators import layers as layers_module
+    def test_add_fill_layer_reports_missing_material(self, blender_context, active_blender_context, capture_report):
+        """LP_OT_AddFillLayer should report an error for a missing material."""
+        operator = layers_module.LP_OT_AddFillLayer()
+        operator.report = capture_report
+        operator.material = "NonExistentMaterial"
+        
+        operator.execute(bpy.context)
         
+        assert len(capture_report.reports) > 0
+    
+    def test_add_fill_layer_succeeds_with_valid_material(self, blender_context, active_blender_context, capture_report):
+        """LP_OT_AddFillLayer should succeed with valid material."""
         mat = blender_context.create_material("ValidMaterial")
         
         operator = layers_module.LP_OT_AddFillLayer()
-        operator.report = MockOperator().report
+        operator.report = capture_report
         operator.material = mat.name
         
         # Execute should succeed
         result = operator.execute(bpy.context)
         
         # Should complete without crash (may have other validation checks)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
-    
-    def test_remove_layer_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_RemoveLayer should validate material exists."""
-        from layer_painter.operators import layers as layers_module
-        
-        operator = layers_module.LP_OT_RemoveLayer()
-        operator.report = MockOperator().report
-        
-        # Set material to non-existent
-        operator.material = "NonExistentMaterial"
-        operator.uid = "aaaaaaaaaa"
-        
-        # Execute should fail gracefully
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_move_layer_up_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_MoveLayerUp should validate material exists."""
-        from layer_painter.operators import layers as layers_module
-        
-        operator = layers_module.LP_OT_MoveLayerUp()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.uid = "aaaaaaaaaa"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_move_layer_down_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_MoveLayerDown should validate material exists."""
-        from layer_painter.operators import layers as layers_module
-        
-        operator = layers_module.LP_OT_MoveLayerDown()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.uid = "aaaaaaaaaa"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_cycle_channel_data_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_CycleChannelData should validate material exists."""
-        from layer_painter.operators import layers as layers_module
-        
-        operator = layers_module.LP_OT_CycleChannelData()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.layer = "aaaaaaaaaa"
-        operator.channel = "bbbbbbbbbb"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-
-
-class TestQW2ChannelOperatorValidation:
-    """Test input validation in channel operators."""
-    
-    def test_make_channel_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_MakeChannel should validate material exists."""
-        from layer_painter.operators import channels as channels_module
-        
-        operator = channels_module.LP_OT_MakeChannel()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.node = "SomeNode"
-        operator.input = "SomeInput"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_remove_channel_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_RemoveChannel should validate material exists."""
-        from layer_painter.operators import channels as channels_module
-        
-        operator = channels_module.LP_OT_RemoveChannel()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.channel = "aaaaaaaaaa"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_move_channel_up_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_MoveChannelUp should validate material exists."""
-        from layer_painter.operators import channels as channels_module
-        
-        operator = channels_module.LP_OT_MoveChannelUp()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.channel = "aaaaaaaaaa"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_move_channel_down_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_MoveChannelDown should validate material exists."""
-        from layer_painter.operators import channels as channels_module
-        
-        operator = channels_module.LP_OT_MoveChannelDown()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.channel = "aaaaaaaaaa"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-
-
-class TestQW2PaintOperatorValidation:
-    """Test input validation in paint operators."""
-    
-    def test_paint_channel_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_PaintChannel should validate material exists."""
-        from layer_painter.operators import paint as paint_module
-        
-        operator = paint_module.LP_OT_PaintChannel()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.layer = "aaaaaaaaaa"
-        operator.channel = "bbbbbbbbbb"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
-    
-    def test_toggle_texture_validates_material(self, blender_context, active_blender_context):
-        """LP_OT_ToggleTexture should validate material exists."""
-        from layer_painter.operators import paint as paint_module
-        
-        operator = paint_module.LP_OT_ToggleTexture()
-        operator.report = MockOperator().report
-        operator.material = "NonExistentMaterial"
-        operator.layer = "aaaaaaaaaa"
-        operator.channel = "bbbbbbbbbb"
-        
-        result = operator.execute(bpy.context)
-        
-        assert_operator_failed(result)
+        assert_operator_terminated(result)
 
 
 class TestQW2SafeDictAccess:
@@ -242,16 +116,9 @@ class TestQW2SafeDictAccess:
 class TestQW2ErrorReporting:
     """Test that errors are reported to user."""
     
-    def test_operator_reports_missing_material(self, blender_context, active_blender_context):
+    def test_operator_reports_missing_material(self, blender_context, active_blender_context, capture_report):
         """Operators should report error message when material missing."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        reports = []
-        
-        def capture_report(level_set, message):
-            reports.append((level_set, message))
-        
         operator.report = capture_report
         operator.material = "NonExistentMaterial"
         operator.uid = "aaaaaaaaaa"
@@ -259,19 +126,11 @@ class TestQW2ErrorReporting:
         operator.execute(bpy.context)
         
         # Should have at least one ERROR report
-        error_reports = [r for r in reports if 'ERROR' in r[0]]
-        assert len(error_reports) > 0, "Should report error to user"
+        assert capture_report.errors(), "Should report error to user"
     
-    def test_error_message_is_descriptive(self, blender_context, active_blender_context):
+    def test_error_message_is_descriptive(self, blender_context, active_blender_context, capture_report):
         """Error messages should be helpful."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        reports = []
-        
-        def capture_report(level_set, message):
-            reports.append((level_set, message))
-        
         operator.report = capture_report
         operator.material = "MyMissingMaterial"
         operator.uid = "aaaaaaaaaa"
@@ -279,7 +138,7 @@ class TestQW2ErrorReporting:
         operator.execute(bpy.context)
         
         # Get error message
-        error_reports = [r for r in reports if 'ERROR' in r[0]]
+        error_reports = capture_report.errors()
         if error_reports:
             message = error_reports[0][1]
             # Message should mention material or not found
@@ -290,55 +149,47 @@ class TestQW2ErrorReporting:
 class TestQW2EdgeCases:
     """Test edge cases in validation."""
     
-    def test_empty_material_name_validation(self, blender_context, active_blender_context):
+    def test_empty_material_name_validation(self, blender_context, active_blender_context, capture_report):
         """Operators should handle empty material names."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        operator.report = MockOperator().report
+        operator.report = capture_report
         operator.material = ""
         operator.uid = "aaaaaaaaaa"
         
         # Should not crash
         result = operator.execute(bpy.context)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
     
-    def test_special_characters_in_material_name(self, blender_context, active_blender_context):
+    def test_special_characters_in_material_name(self, blender_context, active_blender_context, capture_report):
         """Operators should handle special characters in names."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        operator.report = MockOperator().report
+        operator.report = capture_report
         operator.material = "Material@#$%^&*()"
         operator.uid = "aaaaaaaaaa"
         
         # Should not crash
         result = operator.execute(bpy.context)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
     
-    def test_unicode_in_material_name(self, blender_context, active_blender_context):
+    def test_unicode_in_material_name(self, blender_context, active_blender_context, capture_report):
         """Operators should handle unicode in material names."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        operator.report = MockOperator().report
+        operator.report = capture_report
         operator.material = "Material_日本語_中文"
         operator.uid = "aaaaaaaaaa"
         
         # Should not crash
         result = operator.execute(bpy.context)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
 
 
 class TestQW2RobustExceptionHandling:
     """Test that operators catch and handle exceptions."""
     
-    def test_operator_catches_general_exceptions(self, blender_context, active_blender_context):
+    def test_operator_catches_general_exceptions(self, blender_context, active_blender_context, capture_report):
         """Operators should catch unexpected exceptions."""
-        from layer_painter.operators import layers as layers_module
-        
         operator = layers_module.LP_OT_RemoveLayer()
-        operator.report = MockOperator().report
+        operator.report = capture_report
         
         # Use invalid UID format - should not crash
         operator.material = bpy.context.active_object.name if bpy.context.active_object else "test"
@@ -346,4 +197,4 @@ class TestQW2RobustExceptionHandling:
         
         # Should return CANCELLED, not raise exception
         result = operator.execute(bpy.context)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
@@ -10,37 +10,42 @@ Validates that:
 import pytest
 import bpy
 import time
+from layer_painter.data.materials.channels import channel
+from layer_painter.data.materials.layers import layer
 from conftest import (
     BlenderTestContext,
     assert_material_has_uid,
+    BLENDER_FIXTURES,
 )
 
 
+pytestmark = BLENDER_FIXTURES
+
+
+# cache key no real material uid can match, used to check that handlers clear the caches
+STALE_KEY = "stale-entry"
+
+
 class TestQW3DepsgraphDisabled:
     """Test that depsgraph_handler is now a no-op."""
     
-    def test_depsgraph_handler_exists(self):
+    def test_depsgraph_handler_exists(self, handlers):
         """depsgraph_handler should be defined."""
-        from layer_painter import handlers
-        
         assert hasattr(handlers, 'depsgraph_handler'), \
             "depsgraph_handler function should exist"
     
-    def test_depsgraph_handler_is_noop(self):
+    def test_depsgraph_handler_is_noop(self, handlers):
         """depsgraph_handler should be a no-op to avoid CPU overhead."""
-        from layer_painter import handlers
-        
         # Call handler - should return None (no-op)
         result = handlers.depsgraph_handler(None)
         
         # Should be no-op or return None
         assert result is None
     
-    def test_depsgraph_handler_does_not_modify_materials(self, blender_context):
+    def test_depsgraph_handler_does_not_modify_materials(self, handlers, blender_context):
         """depsgraph_handler should not modify material UIDs."""
         mat = blender_context.create_material("DepsgraphTest")
         
-        from layer_painter import handlers
         handlers.set_material_uids()
         original_uid = mat.lp.uid
         
@@ -57,12 +62,10 @@ class TestQW3DepsgraphDisabled:
 class TestQW3OptimizedUIDSync:
     """Test that UID sync only happens at appropriate times."""
     
-    def test_uid_sync_on_load(self, blender_context):
+    def test_uid_sync_on_load(self, handlers, blender_context):
         """UID sync should happen on file load."""
         mat = blender_context.create_material("LoadTest")
         
-        from layer_painter import handlers
-        
         # Before sync - may not have UID depending on initialization
         handlers.set_material_uids()
         
@@ -72,11 +75,10 @@ class TestQW3OptimizedUIDSync:
         # Material should have valid UID
         assert_material_has_uid(mat)
     
-    def test_uid_sync_on_undo_redo(self, blender_context):
+    def test_uid_sync_on_undo_redo(self, handlers, blender_context):
         """UID sync should happen on undo/redo."""
         mat = blender_context.create_material("UndoRedoTest")
         
-        from layer_painter import handlers
         handlers.set_material_uids()
         original_uid = mat.lp.uid
         
@@ -91,40 +93,29 @@ class TestQW3OptimizedUIDSync:
 class TestQW3PerformanceImprovement:
     """Test performance improvements from disabling depsgraph_handler."""
     
-    def test_depsgraph_handler_executes_instantly(self):
+    def test_depsgraph_handler_executes_instantly(self, handlers):
         """depsgraph_handler should execute instantly (no-op)."""
-        from layer_painter import handlers
-        
         # Time the handler execution
-        start = time.time()
+        start = time.perf_counter_ns()
         for _ in range(1000):
             handlers.depsgraph_handler(None)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         
         # Should be nearly instantaneous
         assert elapsed < 0.1, \
             f"depsgraph_handler too slow: {elapsed:.3f}s for 1000 calls"
     
     @pytest.mark.performance
-    def test_interactive_performance_with_many_materials(self, blender_context):
+    def test_interactive_performance_with_many_materials(self, handlers, many_materials):
         """Interactive use should be responsive with many materials."""
-        import time
-        
-        from layer_painter import handlers
-        
-        # Create 50 materials to simulate large project
-        materials = []
-        for i in range(50):
-            mat = blender_context.create_material(f"PerfTest_{i:03d}")
-            materials.append(mat)
-        
+        # 50 shared materials simulate a large project
         handlers.set_material_uids()
         
         # Simulate interactive loop (50 depsgraph updates per frame)
-        start = time.time()
+        start = time.perf_counter_ns()
         for _ in range(50):
             handlers.depsgraph_handler(None)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         
         # Should complete quickly (was 60+x/sec = ~16ms each)
         # Now should be < 1ms
@@ -132,11 +123,8 @@ class TestQW3PerformanceImprovement:
             f"Interactive performance degraded: {elapsed:.3f}s for 50 depsgraph updates"
     
     @pytest.mark.performance
-    def test_cpu_overhead_reduced(self, blender_context):
+    def test_cpu_overhead_reduced(self, handlers, blender_context):
         """CPU overhead should be significantly reduced."""
-        from layer_painter import handlers
-        import time
-        
         # Create baseline
         mat = blender_context.create_material("BaselineTest")
         handlers.set_material_uids()
@@ -144,13 +132,13 @@ class TestQW3PerformanceImprovement:
         # Measure depsgraph_handler overhead
         iterations = 10000
         
-        start = time.time()
+        start = time.perf_counter_ns()
         for _ in range(iterations):
             handlers.depsgraph_handler(None)
-        depsgraph_time = time.time() - start
+        depsgraph_ns = time.perf_counter_ns() - start
         
         # Should be negligible (effectively 0)
-        per_call_us = (depsgraph_time / iterations) * 1_000_000
+        per_call_us = depsgraph_ns / iterations / 1000
         
         # Each call should take << 1 microsecond now
         assert per_call_us < 10, \
@@ -160,70 +148,59 @@ class TestQW3PerformanceImprovement:
 class TestQW3CacheInvalidation:
     """Test that caches are still properly invalidated."""
     
-    def test_load_handler_clears_caches(self, blender_context):
+    def test_load_handler_clears_caches(self, handlers, blender_context):
         """on_load_handler should clear all caches."""
-        from layer_painter import handlers
-        from layer_painter.data.materials import channel, layer
-        
         # Create some materials
         mat = blender_context.create_material("CacheTest")
         handlers.set_material_uids()
+        channel.cached_materials[STALE_KEY] = mat
+        layer.cached_materials[STALE_KEY] = mat
         
         # Call load handler
         handlers.on_load_handler(None)
         
-        # Caches should be cleared (should be empty dict)
-        assert hasattr(channel, 'cached_materials'), \
-            "channel cache should exist"
-        assert hasattr(layer, 'cached_materials'), \
-            "layer cache should exist"
+        # Caches should be cleared (the cache modules themselves are checked once in conftest)
+        assert STALE_KEY not in channel.cached_materials, "channel cache not cleared"
+        assert STALE_KEY not in layer.cached_materials, "layer cache not cleared"
     
-    def test_undo_redo_handler_clears_caches(self, blender_context):
+    def test_undo_redo_handler_clears_caches(self, handlers, blender_context):
         """on_undo_redo_handler should clear caches."""
-        from layer_painter import handlers
-        from layer_painter.data.materials import channel, layer
-        
         mat = blender_context.create_material("UndoTest")
         handlers.set_material_uids()
+        channel.cached_materials[STALE_KEY] = mat
+        layer.cached_materials[STALE_KEY] = mat
         
         # Call undo/redo handler
         handlers.on_undo_redo_handler(None)
         
         # Caches should be cleared
-        assert hasattr(channel, 'cached_materials'), \
-            "channel cache should exist"
-        assert hasattr(layer, 'cached_materials'), \
-            "layer cache should exist"
+        assert STALE_KEY not in channel.cached_materials, "channel cache not cleared"
+        assert STALE_KEY not in layer.cached_materials, "layer cache not cleared"
 
 
 class TestQW3UIResponsiveness:
     """Test that UI remains responsive."""
     
     @pytest.mark.performance
-    def test_ui_redraw_not_blocked_by_depsgraph(self, blender_context):
+    def test_ui_redraw_not_blocked_by_depsgraph(self, handlers, many_materials):
         """UI redraws should not be blocked by depsgraph_handler."""
-        from layer_painter import handlers
-        
-        # Create materials
-        for i in range(20):
-            blender_context.create_material(f"UITest_{i}")
-        
         handlers.set_material_uids()
         
-        # Simulate UI redraw loop with depsgraph updates
-        frame_times = []
-        for frame in range(60):  # 60 frames
-            frame_start = time.time()
-            
+        # Simulate UI redraw loop with depsgraph updates, one timestamp per frame
+        frames = 60
+        start = previous = time.perf_counter_ns()
+        max_frame_ns = 0
+        for frame in range(frames):
             # Simulate 4 depsgraph updates per frame (typical in Blender)
             for _ in range(4):
                 handlers.depsgraph_handler(None)
             
-            frame_time = time.time() - frame_start
-            frame_times.append(frame_time)
+            now = time.perf_counter_ns()
+            max_frame_ns = max(max_frame_ns, now - previous)
+            previous = now
         
-        avg_frame_time = sum(frame_times) / len(frame_times)
-        max_frame_time = max(frame_times)
+        avg_frame_time = (previous - start) / frames / 1e9
+        max_frame_time = max_frame_ns / 1e9
         
         # Average frame time should be negligible
         assert avg_frame_time < 0.001, \
@@ -237,18 +214,17 @@ class TestQW3UIResponsiveness:
 class TestQW3MaterialIntegrity:
     """Test that material integrity is maintained."""
     
-    def test_material_uid_consistent_after_depsgraph(self, blender_context):
+    def test_material_uid_consistent_after_depsgraph(self, handlers, blender_context):
         """Material UID should remain consistent across depsgraph updates."""
         mat = blender_context.create_material("IntegrityTest")
         
-        from layer_painter import handlers
         handlers.set_material_uids()
         
         original_uid = mat.lp.uid
         original_name = mat.name
         
-        # Simulate depsgraph updates
-        for _ in range(100):
+        # Simulate depsgraph updates, the handler is a no-op so a few calls show idempotence
+        for _ in range(10):
             handlers.depsgraph_handler(None)
         
         # Material should be intact
@@ -256,36 +232,29 @@ class TestQW3MaterialIntegrity:
         assert mat.lp.uid == original_uid
         assert_material_has_uid(mat)
     
-    def test_multiple_materials_integrity_after_depsgraph(self, blender_context):
+    def test_multiple_materials_integrity_after_depsgraph(self, handlers, many_materials):
         """Multiple materials should maintain integrity across depsgraph updates."""
-        materials = []
-        for i in range(10):
-            mat = blender_context.create_material(f"IntegrityTest_{i}")
-            materials.append((mat, mat.lp.uid if hasattr(mat, 'lp') else None))
-        
-        from layer_painter import handlers
         handlers.set_material_uids()
         
         # Capture UIDs
-        original_uids = {mat.name: mat.lp.uid for mat, _ in materials}
+        materials = many_materials[:10]
+        original_uids = tuple(mat.lp.uid for mat in materials)
         
         # Simulate depsgraph updates
-        for _ in range(100):
+        for _ in range(10):
             handlers.depsgraph_handler(None)
         
-        # All materials should maintain their UIDs
-        for mat, _ in materials:
-            assert mat.lp.uid == original_uids[mat.name], \
-                f"Material {mat.name} UID changed"
+        # All materials should maintain their UIDs, compared in one go
+        current_uids = tuple(mat.lp.uid for mat in materials)
+        assert current_uids == original_uids, \
+            f"UIDs changed for {[mat.name for mat, old, new in zip(materials, original_uids, current_uids) if old != new]}"
 
 
 class TestQW3BackwardCompatibility:
     """Test backward compatibility of optimization."""
     
-    def test_depsgraph_handler_compatible_with_existing_code(self, blender_context):
+    def test_depsgraph_handler_compatible_with_existing_code(self, handlers, blender_context):
         """Existing code calling depsgraph_handler should work."""
-        from layer_painter import handlers
-        
         mat = blender_context.create_material("CompatTest")
         handlers.set_material_uids()
         
@@ -297,10 +266,8 @@ class TestQW3BackwardCompatibility:
         except Exception as e:
             pytest.fail(f"depsgraph_handler raised exception: {e}")
     
-    def test_undo_redo_workflow_unchanged(self, blender_context):
+    def test_undo_redo_workflow_unchanged(self, handlers, blender_context):
         """Undo/redo workflow should remain unchanged."""
-        from layer_painter import handlers
-        
         mat = blender_context.create_material("UndoWorkflow")
         handlers.set_material_uids()
         uid = mat.lp.uid
@@ -317,27 +284,22 @@ class TestQW3BackwardCompatibility:
 class TestQW3NoSideEffects:
     """Test that optimization introduces no side effects."""
     
-    def test_depsgraph_handler_idempotent(self):
+    def test_depsgraph_handler_idempotent(self, handlers):
         """Multiple depsgraph_handler calls should have same effect."""
-        from layer_painter import handlers
-        
         # Call multiple times - should all be no-ops
         for _ in range(10):
             result = handlers.depsgraph_handler(None)
             assert result is None
     
-    def test_depsgraph_handler_does_not_modify_scene(self, blender_context):
+    def test_depsgraph_handler_does_not_modify_scene(self, handlers, blender_context):
         """depsgraph_handler should not modify scene state."""
-        from layer_painter import handlers
-        
         # Create scene state
-        original_materials = set(bpy.data.materials.keys())
+        original_count = len(bpy.data.materials)
         
         # Call handler many times
         for _ in range(100):
             handlers.depsgraph_handler(None)
         
-        # Scene state should be unchanged
-        current_materials = set(bpy.data.materials.keys())
-        assert current_materials == original_materials, \
-            "depsgraph_handler modified scene state"
+        # Scene state should be unchanged, names are only collected for the failure message
+        assert len(bpy.data.materials) == original_count, \
+            f"depsgraph_handler modified scene state: {sorted(bpy.data.materials.keys())}"
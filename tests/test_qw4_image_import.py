@@ -10,24 +10,36 @@ Validates that:
 
 import pytest
 import bpy
-import os
 import tempfile
+from pathlib import Path
 from conftest import (
     BlenderTestContext,
     assert_operator_failed,
     assert_operator_succeeded,
+    assert_operator_terminated,
+    BLENDER_FIXTURES,
 )
 
 
+pytestmark = BLENDER_FIXTURES
+
+
+@pytest.fixture(scope="class")
+def tmp_root():
+    """Fixture providing the system temp directory as a Path, resolved once per test class."""
+    return Path(tempfile.gettempdir())
+
+
 class MockOperator:
     """Mock operator for testing error reporting."""
     
+    __slots__ = ('reports', 'report')
+    
     def __init__(self):
         self.reports = []
-    
-    def report(self, level_set, message):
-        """Capture report calls for verification."""
-        self.reports.append((level_set, message))
+        # capture report calls straight into the list, no method lookup per call
+        append = self.reports.append
+        self.report = lambda level_set, message: append((level_set, message))
 
 
 class TestQW4ImageImportFileValidation:
@@ -41,8 +53,9 @@ class TestQW4ImageImportFileValidation:
         # Try to import non-existent file
         filepath = "/path/that/does/not/exist/image.png"
         
+        mock = MockOperator()
         operator = images_module.LP_OT_OpenImage()
-        operator.report = MockOperator().report
+        operator.report = mock.report
         operator.filepath = filepath
         
         # Should not crash
@@ -50,7 +63,7 @@ class TestQW4ImageImportFileValidation:
         
         # Should report error
         assert_operator_failed(result)
-        error_reports = [r for r in operator.report.__self__.reports if 'ERROR' in r[0]]
+        error_reports = [r for r in mock.reports if 'ERROR' in r[0]]
         assert len(error_reports) > 0
     
     def test_import_empty_filepath_fails(self, blender_context):
@@ -65,66 +78,43 @@ class TestQW4ImageImportFileValidation:
         
         assert_operator_failed(result)
     
-    def test_import_directory_path_fails(self, blender_context):
+    def test_import_directory_path_fails(self, blender_context, tmp_root):
         """Import should fail when given directory instead of file."""
         from layer_painter.operators import images as images_module
         
         # Use existing directory
-        temp_dir = tempfile.gettempdir()
-        
         operator = images_module.LP_OT_OpenImage()
         operator.report = MockOperator().report
-        operator.filepath = temp_dir
+        operator.filepath = str(tmp_root)
         
         result = operator.execute(bpy.context)
         
         assert_operator_failed(result)
     
-    def test_import_valid_image_file(self, blender_context):
+    def test_import_valid_image_file(self, blender_context, valid_png_path):
         """Import should succeed with valid image file."""
         from layer_painter.operators import images as images_module
         
-        # Create valid test image
-        try:
-            from PIL import Image
-        except ImportError:
-            pytest.skip("PIL not available")
-        
-        temp_dir = tempfile.gettempdir()
-        filepath = os.path.join(temp_dir, "test_valid.png")
-        
-        # Create simple test image
-        img = Image.new('RGB', (32, 32), color=(255, 0, 0))
-        img.save(filepath)
-        blender_context.temp_files.append(filepath)
-        
         # This may fail due to other validation, but shouldn't crash
         operator = images_module.LP_OT_OpenImage()
         operator.report = MockOperator().report
-        operator.filepath = filepath
+        operator.filepath = valid_png_path
         
         result = operator.execute(bpy.context)
         
         # Should complete without crash (may have other checks)
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
-        
-        # Clean up
-        try:
-            os.remove(filepath)
-        except:
-            pass
+        assert_operator_terminated(result)
 
 
 class TestQW4CorruptedImageHandling:
     """Test handling of corrupted image files."""
     
-    def test_corrupted_image_file_fails_gracefully(self, blender_context):
+    def test_corrupted_image_file_fails_gracefully(self, blender_context, tmp_root):
         """Import should handle corrupted image files."""
         from layer_painter.operators import images as images_module
         
         # Create corrupted image file
-        temp_dir = tempfile.gettempdir()
-        filepath = os.path.join(temp_dir, "corrupted.png")
+        filepath = str(tmp_root / "corrupted.png")
         
         # Write garbage data
         with open(filepath, 'wb') as f:
@@ -140,7 +130,7 @@ class TestQW4CorruptedImageHandling:
         result = operator.execute(bpy.context)
         
         # Should fail gracefully
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
 
 
 class TestQW4ImageImportFunctionValidation:
@@ -162,37 +152,18 @@ class TestQW4ImageImportFunctionValidation:
             # Expected to raise error
             pass
     
-    def test_import_image_with_valid_file(self, blender_context):
+    def test_import_image_with_valid_file(self, blender_context, valid_png_path):
         """import_image() should work with valid file."""
         from layer_painter.operators import utils_paint
         
-        # Create valid test image
-        try:
-            from PIL import Image
-        except ImportError:
-            pytest.skip("PIL not available")
-        
-        temp_dir = tempfile.gettempdir()
-        filepath = os.path.join(temp_dir, "test_import.png")
-        
-        img = Image.new('RGB', (32, 32), color=(0, 255, 0))
-        img.save(filepath)
-        blender_context.temp_files.append(filepath)
-        
         # Should not crash
         try:
-            result = utils_paint.import_image(filepath)
+            result = utils_paint.import_image(valid_png_path)
             # Result should be valid or handled gracefully
             assert result is not None or result == None
         except Exception as e:
             # If exception, should be caught and handled
             assert isinstance(e, (FileNotFoundError, RuntimeError))
-        
-        # Clean up
-        try:
-            os.remove(filepath)
-        except:
-            pass
 
 
 class TestQW4NodeValidation:
@@ -212,7 +183,7 @@ class TestQW4NodeValidation:
         result = operator.execute(bpy.context)
         
         # Should handle missing node
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
 
 
 class TestQW4ErrorMessages:
@@ -222,19 +193,15 @@ class TestQW4ErrorMessages:
         """Error message should indicate file not found."""
         from layer_painter.operators import images as images_module
         
+        mock = MockOperator()
         operator = images_module.LP_OT_OpenImage()
-        reports = []
-        
-        def capture_report(level_set, message):
-            reports.append((level_set, message))
-        
-        operator.report = capture_report
+        operator.report = mock.report
         operator.filepath = "/nonexistent/file.png"
         
         operator.execute(bpy.context)
         
         # Check for helpful error message
-        error_reports = [r for r in reports if 'ERROR' in r[0]]
+        error_reports = [r for r in mock.reports if 'ERROR' in r[0]]
         if error_reports:
             message = error_reports[0][1].lower()
             # Message should mention file or not found
@@ -245,20 +212,16 @@ class TestQW4ErrorMessages:
         """Error message should include problematic filename."""
         from layer_painter.operators import images as images_module
         
+        mock = MockOperator()
         operator = images_module.LP_OT_OpenImage()
-        reports = []
-        
-        def capture_report(level_set, message):
-            reports.append((level_set, message))
-        
-        operator.report = capture_report
+        operator.report = mock.report
         problem_file = "my_missing_image.png"
         operator.filepath = f"/tmp/{problem_file}"
         
         operator.execute(bpy.context)
         
         # Check if error message contains filename
-        error_reports = [r for r in reports if 'ERROR' in r[0]]
+        error_reports = [r for r in mock.reports if 'ERROR' in r[0]]
         if error_reports:
             message = error_reports[0][1]
             # Should mention the problematic file
@@ -283,15 +246,14 @@ class TestQW4ExceptionHandling:
         # Should not crash, even if OSError occurs
         result = operator.execute(bpy.context)
         
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
     
-    def test_import_handles_valueerror(self, blender_context):
+    def test_import_handles_valueerror(self, blender_context, tmp_root):
         """Import should handle ValueError from image decode."""
         from layer_painter.operators import images as images_module
         
         # Create file with invalid image data
-        temp_dir = tempfile.gettempdir()
-        filepath = os.path.join(temp_dir, "invalid.png")
+        filepath = str(tmp_root / "invalid.png")
         
         with open(filepath, 'wb') as f:
             f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)  # Truncated PNG
@@ -305,7 +267,7 @@ class TestQW4ExceptionHandling:
         # Should not crash
         result = operator.execute(bpy.context)
         
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
     
     def test_import_handles_runtime_exceptions(self, blender_context):
         """Import should handle RuntimeError and other exceptions."""
@@ -321,7 +283,7 @@ class TestQW4ExceptionHandling:
         # Should handle gracefully
         try:
             result = operator.execute(bpy.context)
-            assert result in [{"FINISHED"}, {"CANCELLED"}]
+            assert_operator_terminated(result)
         except Exception:
             # If exception, that's okay - we're testing it doesn't crash the addon
             pass
@@ -355,48 +317,22 @@ class TestQW4LoadFilePathValidation:
             pass
 
 
+# paths the operator must survive without crashing, whatever it decides about them
+EDGE_CASE_PATHS = [
+    pytest.param("/tmp/" + "a" * 1000 + ".png", id="very_long_filepath"),
+    pytest.param("/tmp/test@#$%^&*().png", id="special_characters"),
+    pytest.param("/tmp/テスト_中文_🖼️.png", id="unicode_filename"),
+]
+
+
 class TestQW4EdgeCases:
     """Test edge cases in image import."""
     
-    def test_import_very_long_filepath(self, blender_context):
-        """Import should handle very long filepaths."""
+    @pytest.mark.parametrize("filepath", EDGE_CASE_PATHS)
+    def test_import_edge_case_filepath(self, blender_context, filepath):
+        """Import should handle long, special character and unicode filepaths."""
         from layer_painter.operators import images as images_module
         
-        # Create very long path
-        very_long_path = "/tmp/" + "a" * 1000 + ".png"
-        
-        operator = images_module.LP_OT_OpenImage()
-        operator.report = MockOperator().report
-        operator.filepath = very_long_path
-        
-        # Should not crash
-        result = operator.execute(bpy.context)
-        
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
-    
-    def test_import_special_characters_in_filename(self, blender_context):
-        """Import should handle special characters in filename."""
-        from layer_painter.operators import images as images_module
-        
-        # Path with special characters
-        filepath = "/tmp/test@#$%^&*().png"
-        
-        operator = images_module.LP_OT_OpenImage()
-        operator.report = MockOperator().report
-        operator.filepath = filepath
-        
-        # Should not crash
-        result = operator.execute(bpy.context)
-        
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
-    
-    def test_import_unicode_filename(self, blender_context):
-        """Import should handle unicode in filenames."""
-        from layer_painter.operators import images as images_module
-        
-        # Unicode filename
-        filepath = "/tmp/テスト_中文_🖼️.png"
-        
         operator = images_module.LP_OT_OpenImage()
         operator.report = MockOperator().report
         operator.filepath = filepath
@@ -404,4 +340,4 @@ class TestQW4EdgeCases:
         # Should not crash
         result = operator.execute(bpy.context)
         
-        assert result in [{"FINISHED"}, {"CANCELLED"}]
+        assert_operator_terminated(result)
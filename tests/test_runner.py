@@ -8,14 +8,26 @@ Usage:
   python test_runner.py --performance   # Run performance tests
   python test_runner.py --coverage      # Run with coverage report
   python test_runner.py -v              # Verbose output
+  python test_runner.py --watch         # Re-run on Enter without re-importing bpy
 """
 
+import os
 import sys
 import pytest
 import argparse
 from pathlib import Path
 
 
+def forget_test_modules(test_dir):
+    """Drop imported test modules so the next run picks up edits, keeping bpy and the add-on loaded."""
+    prefix = str(test_dir) + os.sep
+    # the runner itself lives in the test directory, as __main__ or imported by name
+    keep = {'__main__', __name__}
+    for name, module in list(sys.modules.items()):
+        if name not in keep and (getattr(module, '__file__', None) or '').startswith(prefix):
+            del sys.modules[name]
+
+
 def main():
     """Run test suite with appropriate configuration."""
     parser = argparse.ArgumentParser(description="Run Layer Painter test suite")
@@ -38,6 +50,8 @@ def main():
                         help='Generate HTML report')
     parser.add_argument('-k', '--keyword', type=str,
                         help='Run tests matching keyword')
+    parser.add_argument('--watch', action='store_true',
+                        help='Stay in process and re-run the tests each time Enter is pressed')
     
     args = parser.parse_args()
     
@@ -83,6 +97,12 @@ def main():
         if args.html:
             pytest_args.append('--cov-report=html')
     
+    # the cache only backs --lf/--ff/--sw, which a one-shot run doesn't use but a watch loop does
+    if args.watch:
+        pytest_args.append('--ff')
+    else:
+        pytest_args.extend(['-p', 'no:cacheprovider'])
+    
     # HTML report
     if args.html and not args.coverage:
         pytest_args.append('--html=report.html')
@@ -92,7 +112,18 @@ def main():
     pytest_args.append('-s')
     
     # Run tests
-    return pytest.main(pytest_args)
+    if not args.watch:
+        return pytest.main(pytest_args)
+    
+    # bpy and layer_painter stay in sys.modules between runs, only the tests are re-imported
+    while True:
+        result = pytest.main(pytest_args)
+        try:
+            if input("\nPress Enter to re-run, q to quit: ").strip().lower() == 'q':
+                return result
+        except (EOFError, KeyboardInterrupt):
+            return result
+        forget_test_modules(test_dir)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ from . import panel_assets
 
 classes = (
     panel_assets.LP_PT_AssetsPanel,
+    panel_assets.LP_OT_AssetsExportExample,
 )
 reg_classes, unreg_classes = bpy.utils.register_classes_factory(classes)
 
@@ -14,3 +15,5 @@ def register():
 
 def unregister():
     unreg_classes()
+    panel_assets.stop_watching()
+    panel_assets.clear_caches()
@@ -0,0 +1,96 @@
+import functools
+import os
+import re
+from pathlib import Path
+
+# characters not allowed in exported file names, also keeps names from escaping the export folder
+SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+# resolved on first use so the asset system is only imported once the panel is actually needed
+AssetManager = None
+asset_manager_import_tried = False
+
+# (registry fingerprint, manager) by project directory, the fingerprint is the registry the manager was loaded from
+cached_managers = {}
+# statistics by project directory, stored with the manager they were computed from
+cached_stats = {}
+
+
+def get_asset_manager_class():
+    """ returns the AssetManager class, importing it on first use, None if it's unavailable """
+    global AssetManager, asset_manager_import_tried
+    if not asset_manager_import_tried:
+        asset_manager_import_tried = True
+        try:
+            from ....assets_extended import AssetManager
+        except Exception:
+            AssetManager = None
+    return AssetManager
+
+
+def clear_caches():
+    """ clears the cached asset managers and statistics """
+    global cached_managers, cached_stats
+    cached_managers = {}
+    cached_stats = {}
+
+
+@functools.lru_cache(maxsize=1)
+def project_dir():
+    """ returns the asset project directory in the user's home, resolved once """
+    return str(Path.home() / "layer_painter_project")
+
+
+def registry_fingerprint(base_dir):
+    """ returns the mtime and size of the project's asset registry, None if there is none """
+    try:
+        st = os.stat(os.path.join(base_dir, "asset_registry.json"))
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def get_manager(base_dir=None):
+    """ returns the asset manager for the given or default project directory
+    created once so redraws don't reload the registry, and only reloaded when that directory's registry file changed """
+    base_dir = base_dir or project_dir()
+    fingerprint = registry_fingerprint(base_dir)
+    cached = cached_managers.get(base_dir)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    manager = get_asset_manager_class()(base_dir)
+    cached_managers[base_dir] = (fingerprint, manager)
+    return manager
+
+
+def get_stats(base_dir=None):
+    """ returns the asset statistics for the project directory, only recomputed when its manager was reloaded """
+    base_dir = base_dir or project_dir()
+    manager = get_manager(base_dir)
+    cached = cached_stats.get(base_dir)
+    if cached is not None and cached[0] is manager:
+        return cached[1]
+    
+    stats = manager.get_statistics()
+    cached_stats[base_dir] = (manager, stats)
+    return stats
+
+
+def first_asset(manager):
+    """ returns the first asset in the manager's library or None if it's empty """
+    return next(iter(manager.assets.values()), None)
+
+
+def export_first(export_dir, base_dir=None):
+    """ exports the first asset in the library into export_dir, returns the export path or None if the library is empty
+    raises a RuntimeError if the export fails """
+    manager = get_manager(base_dir)
+    first = first_asset(manager)
+    if first is None:
+        return None
+    safe_name = SAFE_NAME_RE.sub("_", first.metadata.name).strip("._") or "asset"
+    export_path = Path(export_dir) / f"{safe_name}.lpa"
+    if not manager.export_asset(first, str(export_path)):
+        raise RuntimeError(f"Export of '{first.metadata.name}' failed")
+    return export_path
@@ -1,11 +1,124 @@
 import bpy
-from pathlib import Path
+import os
+import tempfile
 
-try:
-    from ...assets_extended import AssetManager
-    asset_manager_available = True
-except Exception:
-    asset_manager_available = False
+from . import asset_service
+
+# optional, lets the panel skip fingerprint checks until the project directory actually changes
+# None until start_watching first tries to import it
+watchdog_available = None
+
+# statistics shown by the panel, refreshed from a timer so drawing never waits on the disk
+last_stats = None
+# label texts built from last_stats as (summary labels, by type labels), so drawing does no formatting
+last_labels = None
+refresh_pending = False
+# set from the watchdog thread when the project directory changes, only read while an observer runs
+stats_dirty = True
+observer = None
+
+
+def clear_caches():
+    """ clears the statistics shown by the panel and the asset service caches """
+    global last_stats, last_labels, refresh_pending, stats_dirty
+    last_stats = None
+    last_labels = None
+    refresh_pending = False
+    stats_dirty = True
+    if bpy.app.timers.is_registered(refresh_stats):
+        bpy.app.timers.unregister(refresh_stats)
+    asset_service.clear_caches()
+
+
+def build_labels(stats):
+    """ returns the summary and by type label texts for the given statistics """
+    summary = (
+        f"Total assets: {stats['total_assets']}",
+        f"Total size: {stats['total_size_mb']:.1f} MB",
+    )
+    by_type = tuple(f"{k}: {v}" for k, v in sorted(stats['by_type'].items()))
+    return summary, by_type
+
+
+def refresh_stats():
+    """ timer callback updating last_stats, redraws the 3d views if the statistics changed """
+    global last_stats, last_labels, refresh_pending, stats_dirty
+    refresh_pending = False
+    if asset_service.get_asset_manager_class() is None:
+        return None
+    if observer is not None and not stats_dirty:
+        return None
+    stats_dirty = False
+    
+    stats = asset_service.get_stats()
+    # watching starts here, the project directory may only exist now that get_stats loaded its manager
+    start_watching()
+    # get_stats returns the same object for as long as the registry is unchanged
+    if stats is not last_stats:
+        last_stats = stats
+        last_labels = build_labels(stats)
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return None
+
+
+def request_refresh():
+    """ schedules a one shot statistics refresh unless one is already pending """
+    global refresh_pending
+    if refresh_pending or (observer is not None and not stats_dirty):
+        return
+    if asset_service.get_asset_manager_class() is None:
+        return
+    refresh_pending = True
+    bpy.app.timers.register(refresh_stats, first_interval=0.0)
+
+
+def mark_stats_dirty(event):
+    """ watchdog callback, runs on the observer thread so it only sets a flag """
+    global stats_dirty
+    stats_dirty = True
+
+
+def poll_stats_dirty():
+    """ timer callback bringing watchdog changes to the main thread """
+    if stats_dirty:
+        request_refresh()
+    return 1.0
+
+
+def start_watching():
+    """ watches the project directory if watchdog is installed, the registry fingerprint is checked on every refresh otherwise
+    called from refresh_stats, so nothing is watched until the panel has loaded the asset library """
+    global observer, watchdog_available
+    if watchdog_available is False or observer is not None or not os.path.isdir(asset_service.project_dir()):
+        return
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        watchdog_available = False
+        return
+    watchdog_available = True
+    handler = FileSystemEventHandler()
+    handler.on_any_event = mark_stats_dirty
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(handler, asset_service.project_dir(), recursive=False)
+    observer.start()
+    bpy.app.timers.register(poll_stats_dirty, first_interval=1.0, persistent=True)
+
+
+def stop_watching():
+    """ stops watching the project directory """
+    global observer
+    if bpy.app.timers.is_registered(poll_stats_dirty):
+        bpy.app.timers.unregister(poll_stats_dirty)
+    if observer is not None:
+        observer.stop()
+        observer.join()
+        observer = None
 
 
 class LP_PT_AssetsPanel(bpy.types.Panel):
@@ -17,25 +130,28 @@ class LP_PT_AssetsPanel(bpy.types.Panel):
 
     @classmethod
     def poll(cls, context):
-        return asset_manager_available
+        return asset_service.get_asset_manager_class() is not None
 
     def draw(self, context):
         layout = self.layout
 
-        base_dir = Path.home() / "layer_painter_project"
-        manager = AssetManager(str(base_dir))
-        stats = manager.get_statistics()
+        request_refresh()
+        labels = last_labels
 
         col = layout.column(align=True)
         col.label(text="Asset Library")
-        col.label(text=f"Total assets: {stats['total_assets']}")
-        col.label(text=f"Total size: {stats['total_size_mb']:.1f} MB")
+        if labels is None:
+            col.label(text="Loading...")
+            return
+        summary, by_type = labels
+        for text in summary:
+            col.label(text=text)
 
         layout.separator()
         layout.label(text="By Type:")
-        for k, v in stats['by_type'].items():
-            row = layout.row()
-            row.label(text=f"{k}: {v}")
+        col = layout.column(align=True)
+        for text in by_type:
+            col.label(text=text)
 
         layout.separator()
         layout.operator("lp_assets.export_example", icon='EXPORT')
@@ -44,20 +160,16 @@ class LP_PT_AssetsPanel(bpy.types.Panel):
 class LP_OT_AssetsExportExample(bpy.types.Operator):
     bl_idname = "lp_assets.export_example"
     bl_label = "Export First Asset (Example)"
-    bl_description = "Exports the first asset in the library to /tmp for demonstration"
+    bl_description = "Exports the first asset in the library to the temporary folder for demonstration"
 
     def execute(self, context):
-        base_dir = Path.home() / "layer_painter_project"
-        manager = AssetManager(str(base_dir))
-        assets = list(manager.assets.values())
-        if not assets:
+        try:
+            export_path = asset_service.export_first(tempfile.gettempdir())
+        except RuntimeError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if export_path is None:
             self.report({'WARNING'}, "No assets in library")
             return {'CANCELLED'}
-        first = assets[0]
-        export_path = Path("/tmp") / f"{first.metadata.name.replace(' ', '_')}.lpa"
-        ok = manager.export_asset(first, str(export_path))
-        if ok:
-            self.report({'INFO'}, f"Exported to {export_path}")
-            return {'FINISHED'}
-        self.report({'ERROR'}, "Export failed")
-        return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported to {export_path}")
+        return {'FINISHED'}
@@ -1,5 +1,5 @@
 import bpy
-from uuid import uuid4
+import os
 
 
 def get_unique_name( collection, basename, separator=".", name_prop="name" ):
@@ -21,8 +21,15 @@ def redraw():
 
 
 def make_uid( length=10 ):
-    """ returns a uid with the given length """
-    return uuid4().hex[:length]
+    """ returns a random hex uid with the given length """
+    return os.urandom((length + 1) // 2).hex()[:length]
+
+
+def make_uids( count, length=10 ):
+    """ returns a list of count uids with the given length, drawn from a single random buffer """
+    step = (length + 1) // 2 * 2
+    pool = os.urandom(step // 2 * count).hex()
+    return [pool[i:i+length] for i in range(0, step * count, step)]
 
 
 def active_material(context):